@@ -3,6 +3,10 @@
 
 """
 Generate an icon for the KeyRemover application
+
+This runs at build time (see build_app.sh), not at app startup. For
+faster builds, pillow-simd can be installed in place of Pillow to speed
+up the resize steps.
 """
 
 from PIL import Image, ImageDraw, ImageFont
@@ -114,12 +118,16 @@ def create_key_remover_icon():
     # Save as PNG
     icon.save('resources/icon.png')
     
-    # Save in multiple sizes for macOS icon set
-    sizes = [16, 32, 64, 128, 256, 512, 1024]
+    # Save in multiple sizes for macOS icon set. Resize each step from
+    # the previous (larger) result rather than from the 1024px original,
+    # which halves the resampling kernel work per step
+    sizes = [1024, 512, 256, 128, 64, 32, 16]
+    if not os.path.exists('resources/icon.iconset'):
+        os.makedirs('resources/icon.iconset')
+    resized_icon = icon
     for size in sizes:
-        resized_icon = icon.resize((size, size), Image.LANCZOS)
-        if not os.path.exists(f'resources/icon.iconset'):
-            os.makedirs(f'resources/icon.iconset')
+        if resized_icon.size != (size, size):
+            resized_icon = resized_icon.resize((size, size), Image.LANCZOS)
         resized_icon.save(f'resources/icon.iconset/icon_{size}x{size}.png')
     
     print("Icons generated in resources/ directory")
@@ -6,9 +6,13 @@ KeyRemover - A tool to completely remove macOS applications and their trial data
 """
 
 import os
+import re
 import sys
 import shutil
+import fnmatch
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import plistlib
 import getpass
@@ -23,200 +27,442 @@ class KeyRemover:
         """Initialize the KeyRemover with common directories to check"""
         self.home_dir = Path.home()
         self.applications_dir = Path("/Applications")
-        
-        # Common directories where apps store data
+
+        # Common directories where apps store data, kept as plain strings
+        # since the scan works on strings and only ever joins names onto
+        # them
+        home = str(self.home_dir)
         self.data_dirs = [
-            self.home_dir / "Library" / "Application Support",
-            self.home_dir / "Library" / "Preferences",
-            self.home_dir / "Library" / "Caches",
-            self.home_dir / "Library" / "Logs",
-            self.home_dir / "Library" / "Containers",
-            self.home_dir / "Library" / "Application Scripts",
-            self.home_dir / "Library" / "Saved Application State",
-            Path("/Library") / "Application Support",
-            Path("/Library") / "Preferences",
-            Path("/Library") / "Caches",
+            os.path.join(home, "Library", "Application Support"),
+            os.path.join(home, "Library", "Preferences"),
+            os.path.join(home, "Library", "Caches"),
+            os.path.join(home, "Library", "Logs"),
+            os.path.join(home, "Library", "Containers"),
+            os.path.join(home, "Library", "Application Scripts"),
+            os.path.join(home, "Library", "Saved Application State"),
+            "/Library/Application Support",
+            "/Library/Preferences",
+            "/Library/Caches",
         ]
-        
+
         # App Store specific directories
         self.app_store_dirs = [
-            Path("/private/var/db/receipts"),
-            self.home_dir / "Library" / "Group Containers",
+            "/private/var/db/receipts",
+            os.path.join(home, "Library", "Group Containers"),
         ]
-        
+
         # Add App Store directories to data_dirs
         self.data_dirs.extend(self.app_store_dirs)
-        
+
+        # Filter out missing directories once so repeated removals don't
+        # re-stat every candidate directory
+        self.existing_data_dirs = [d for d in self.data_dirs if os.path.isdir(d)]
+
+        # Path prefixes whose contents need sudo to remove
+        self._system_prefixes = ('/Library', '/private')
+
+        # Compiled pattern regexes keyed by pattern tuple, so repeated
+        # removals reuse the compiled form
+        self._pattern_cache = {}
+
+        # Parsed Info.plist data keyed by app path, so retries (e.g. the
+        # GUI's retry-with-sudo pass) don't re-parse the plist
+        self._app_info_cache = {}
+
         # Password for sudo operations
         self.sudo_password = None
+
+        # In-flight defaults delete processes, reaped at the end of a
+        # removal
+        self._defaults_procs = []
+
+        # Serializes sudo subprocess calls when directories are scanned
+        # in parallel, since each one writes the password to stdin
+        self._sudo_lock = threading.Lock()
+
+        # Whether sudo's credential cache has been primed with sudo -v
+        self._sudo_primed = False
     
     def get_app_info(self, app_path):
         """Get the application bundle identifier from Info.plist"""
+        cache_key = str(app_path)
+        cached = self._app_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         info_plist_path = app_path / "Contents" / "Info.plist"
-        
+
         if not info_plist_path.exists():
             return None
-            
+
         try:
             with open(info_plist_path, 'rb') as f:
                 info = plistlib.load(f)
-                return {
+                app_info = {
                     'bundle_id': info.get('CFBundleIdentifier'),
                     'name': info.get('CFBundleName', app_path.stem),
                     'display_name': info.get('CFBundleDisplayName', app_path.stem)
                 }
+                self._app_info_cache[cache_key] = app_info
+                return app_info
         except Exception as e:
             print(f"Error reading Info.plist: {e}")
             return None
     
     def find_app_path(self, app_name):
-        """Find the application path"""
+        """Find the application path
+
+        Tries an exact match first, then falls back to a case-insensitive
+        scan that compares entry names against one precomputed casefolded
+        target.
+        """
         # Try direct match
         app_path = self.applications_dir / f"{app_name}.app"
         if app_path.exists():
             return app_path
             
-        # Try case-insensitive search
-        for item in self.applications_dir.glob("*.app"):
-            if item.stem.lower() == app_name.lower():
-                return item
-                
+        # Try case-insensitive search with a single directory scan,
+        # comparing entry names as strings instead of allocating a Path
+        # per entry
+        target = f"{app_name}.app".casefold()
+        try:
+            with os.scandir(str(self.applications_dir)) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".app") and entry.name.casefold() == target:
+                        return Path(entry.path)
+        except FileNotFoundError:
+            pass
+
         return None
     
+    def _py_fast_rmtree(self, path):
+        """Recursively delete a tree with dir_fd-relative syscalls
+
+        Python fallback for when /bin/rm is unavailable. Unlinking
+        relative to an already-open directory fd (the unlinkat family)
+        spares the kernel a full path resolution per entry, closing much
+        of the gap between shutil.rmtree and rm -r. Falls back to
+        shutil.rmtree where dir_fd support is missing.
+        """
+        if not {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd:
+            shutil.rmtree(path)
+            return
+
+        def clear(fd):
+            with os.scandir(fd) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        child = os.open(entry.name,
+                                        os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW,
+                                        dir_fd=fd)
+                        try:
+                            clear(child)
+                        finally:
+                            os.close(child)
+                        os.rmdir(entry.name, dir_fd=fd)
+                    else:
+                        os.unlink(entry.name, dir_fd=fd)
+
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        try:
+            clear(fd)
+        finally:
+            os.close(fd)
+        os.rmdir(path)
+
+    def _fast_rmtree(self, path):
+        """Remove a directory tree, preferring /bin/rm over shutil.rmtree
+
+        shutil.rmtree pays Python-level overhead for every entry, which adds
+        up on large app bundles (100k+ files). /bin/rm walks the tree in C.
+        Fall back to the dir_fd-based Python walker if /bin/rm is
+        unavailable. A permission failure is raised as PermissionError so
+        callers can escalate to sudo.
+        """
+        path = os.fspath(path)
+        try:
+            result = subprocess.run(["/bin/rm", "-rf", "--", path],
+                                    capture_output=True, text=True)
+        except FileNotFoundError:
+            self._py_fast_rmtree(path)
+            return
+
+        if result.returncode != 0:
+            stderr = result.stderr.strip()
+            if "Permission denied" in stderr or "Operation not permitted" in stderr:
+                raise PermissionError(stderr)
+            raise OSError(stderr)
+
+    def _prime_sudo(self, password):
+        """Validate the password once with sudo -v so that later sudo
+        calls reuse the cached credential instead of re-authenticating"""
+        process = subprocess.Popen(
+            ["sudo", "-S", "-v"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        # Send the password to stdin
+        stdout, stderr = process.communicate(input=password + "\n")
+
+        if process.returncode != 0:
+            if "incorrect password" in stderr.lower():
+                return "Incorrect password"
+            return f"Command failed: {stderr}"
+
+        self._sudo_primed = True
+        return None
+
     def run_with_sudo(self, cmd, password=None):
         """Run a command with sudo privileges"""
         if password is None and self.sudo_password is None:
             return None, "No password provided for sudo operation"
-        
+
         password_to_use = password if password is not None else self.sudo_password
-        
-        # Create a sudo command that reads password from stdin
-        sudo_cmd = ["sudo", "-S"] + cmd
-        
+
         try:
-            process = subprocess.Popen(
-                sudo_cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Send the password to stdin
-            stdout, stderr = process.communicate(input=password_to_use + "\n")
-            
-            if process.returncode != 0:
-                if "incorrect password" in stderr.lower():
-                    return None, "Incorrect password"
-                return None, f"Command failed: {stderr}"
-            
-            return stdout, None
+            with self._sudo_lock:
+                if not self._sudo_primed:
+                    error = self._prime_sudo(password_to_use)
+                    if error:
+                        return None, error
+
+                # The credential cache is warm: run non-interactively with
+                # no password plumbing. -n makes sudo fail instead of
+                # prompting if the cache expired, in which case we re-prime
+                # once and retry
+                result = subprocess.run(
+                    ["sudo", "-n"] + cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+                if result.returncode != 0 and "password" in result.stderr.lower():
+                    error = self._prime_sudo(password_to_use)
+                    if error:
+                        return None, error
+                    result = subprocess.run(
+                        ["sudo", "-n"] + cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True
+                    )
+
+            if result.returncode != 0:
+                return None, f"Command failed: {result.stderr}"
+
+            return result.stdout, None
         except Exception as e:
             return None, f"Error executing sudo command: {e}"
     
-    def is_app_store_app(self, app_info):
-        """Check if the application is from the App Store"""
+    def is_app_store_app(self, app_info, app_path=None):
+        """Check if the application is from the App Store
+
+        Pass app_path when it is already known to avoid re-scanning
+        /Applications for it.
+        """
         if not app_info or not app_info.get('bundle_id'):
             return False
-            
+
         bundle_id = app_info.get('bundle_id')
-        
+
         # Check for receipt file which indicates App Store installation
         receipt_path = Path("/private/var/db/receipts") / f"{bundle_id}.plist"
         if receipt_path.exists():
             return True
-            
+
         # Check for App Store metadata in the app bundle
-        app_name = app_info.get('name')
-        if app_name:
-            app_path = self.find_app_path(app_name)
-            if app_path and (app_path / "Contents" / "_MASReceipt").exists():
-                return True
-                
+        if app_path is None:
+            app_name = app_info.get('name')
+            if app_name:
+                app_path = self.find_app_path(app_name)
+        if app_path and (app_path / "Contents" / "_MASReceipt").exists():
+            return True
+
         return False
     
-    def remove_app_files(self, app_info, password=None):
+    # Paths per sudo rm invocation, kept well under ARG_MAX
+    SUDO_RM_BATCH_SIZE = 1000
+
+    def _compile_patterns(self, patterns):
+        """Compile a tuple of glob patterns into one regex, caching the
+        result so repeated removals skip recompilation"""
+        if not patterns:
+            # An empty alternation compiles to a match-everything regex,
+            # which for this tool means "delete everything it scans"
+            raise ValueError("refusing to compile an empty pattern list")
+        combined = self._pattern_cache.get(patterns)
+        if combined is None:
+            combined = re.compile(
+                '|'.join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+            self._pattern_cache[patterns] = combined
+        return combined
+
+    def _scan_one(self, directory, combined):
+        """Collect matching entries from one scandir pass as
+        (path, is_dir) pairs
+
+        The type check uses the stat cached on the DirEntry, so no extra
+        syscall is made per entry. Matched directories are not recursed
+        into since they are removed wholesale.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [(entry.path, entry.is_dir(follow_symlinks=False))
+                        for entry in entries if combined.match(entry.name)]
+        except FileNotFoundError:
+            return []
+
+    def _scan_and_remove(self, directory, combined, is_app_store, password, report):
+        """Scan one data directory and remove everything matching the
+        combined pattern regex, reporting each removed path and returning
+        the paths that need a sudo removal"""
+        sudo_targets = []
+
+        for path, is_dir in self._scan_one(directory, combined):
+            try:
+                # For system directories that need sudo
+                if path.startswith(self._system_prefixes) or is_app_store:
+                    if password or self.sudo_password:
+                        sudo_targets.append(path)
+                else:
+                    # Regular removal for user directories
+                    if is_dir:
+                        self._fast_rmtree(path)
+                    else:
+                        os.unlink(path)
+                    report(path)
+            except Exception as e:
+                print(f"Error removing {path}: {e}")
+
+        return sudo_targets
+
+    def _remove_with_sudo_batched(self, sudo_targets, password, report):
+        """Remove the collected paths with as few sudo invocations as
+        possible instead of one subprocess per path"""
+        for start in range(0, len(sudo_targets), self.SUDO_RM_BATCH_SIZE):
+            batch = sudo_targets[start:start + self.SUDO_RM_BATCH_SIZE]
+            output, error = self.run_with_sudo(["rm", "-rf", "--"] + batch, password)
+            if error:
+                print(f"Error removing {len(batch)} items with sudo: {error}")
+            else:
+                for path in batch:
+                    report(f"{path} (sudo)")
+
+    def remove_app_files(self, app_info, is_app_store=None, password=None,
+                         on_removed=None):
         """
         Remove all files associated with the application
+
+        is_app_store may be passed by callers that already computed it so
+        the receipt stats and /Applications scan are not repeated. When
+        on_removed is given, each removed path is streamed to it as it
+        happens and the returned list stays empty, so callers like the
+        GUI don't hold every path in memory.
         """
         if not app_info:
             return []
-            
+
         bundle_id = app_info.get('bundle_id')
         app_name = app_info.get('name')
         display_name = app_info.get('display_name')
-        
+
         removed_files = []
+        report = on_removed if on_removed is not None else removed_files.append
         
-        # Search patterns based on app info
+        # Search patterns based on app info. The broad com.*.<name> glob is
+        # only used when no bundle_id is known: the bundle_id pattern
+        # already covers the vendor-prefixed domain, and the broad form
+        # pulls in unrelated matches
         patterns = [
             f"{bundle_id}*" if bundle_id else None,
             f"{app_name}*" if app_name else None,
             f"{display_name}*" if display_name else None,
-            f"com.*.{app_name}*" if app_name else None,
+            f"com.*.{app_name}*" if app_name and not bundle_id else None,
         ]
-        patterns = [p for p in patterns if p]
-        
-        # Check if this is an App Store app
-        is_app_store = self.is_app_store_app(app_info)
-        
-        # Remove files from common directories
-        for directory in self.data_dirs:
-            if not directory.exists():
-                continue
-                
-            for pattern in patterns:
-                for item in directory.glob(pattern):
-                    try:
-                        # For system directories that need sudo
-                        if str(item).startswith(('/Library', '/private')) or is_app_store:
-                            if password or self.sudo_password:
-                                cmd = ["rm", "-rf", str(item)]
-                                output, error = self.run_with_sudo(cmd, password)
-                                if error:
-                                    print(f"Error removing {item} with sudo: {error}")
-                                else:
-                                    removed_files.append(f"{item} (sudo)")
-                        else:
-                            # Regular removal for user directories
-                            if item.is_dir():
-                                shutil.rmtree(item)
-                            else:
-                                item.unlink()
-                            removed_files.append(str(item))
-                    except Exception as e:
-                        print(f"Error removing {item}: {e}")
+        # Dedupe while preserving order; name and display name are often
+        # identical
+        patterns = list(dict.fromkeys(p for p in patterns if p))
+
+        # An Info.plist can yield no usable identifiers at all (empty
+        # CFBundleName etc.). An empty pattern list must mean "match
+        # nothing": re.compile('') would match every entry name and wipe
+        # the data directories wholesale
+        if not patterns:
+            return removed_files
+
+        # Combine all patterns into one regex so each directory is scanned
+        # exactly once instead of once per pattern
+        combined = self._compile_patterns(tuple(patterns))
+
+        # Check if this is an App Store app, unless the caller already did
+        if is_app_store is None:
+            is_app_store = self.is_app_store_app(app_info)
+
+        # The data directories are disjoint and the work is dominated by
+        # filesystem syscalls, so scan them in parallel
+        sudo_targets = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self._scan_and_remove, directory, combined,
+                                is_app_store, password, report)
+                for directory in self.existing_data_dirs
+            ]
+            for future in as_completed(futures):
+                sudo_targets.extend(future.result())
+
+        # Remove everything that needs privileges in one batched sudo call
+        # instead of forking a subprocess per path
+        if sudo_targets:
+            self._remove_with_sudo_batched(sudo_targets, password, report)
         
         # Run defaults delete if we have a bundle_id
         if bundle_id:
             try:
-                # Try without sudo first
-                subprocess.run(['defaults', 'delete', bundle_id], 
-                               capture_output=True, check=False)
-                removed_files.append(f"defaults domain: {bundle_id}")
-                
+                # Try without sudo first. Fire and forget: the plist files
+                # themselves are already being removed, so there is no need
+                # to block on the subprocess here — it is reaped at the end
+                # of remove_application
+                self._defaults_procs.append(subprocess.Popen(
+                    ['defaults', 'delete', bundle_id],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+                report(f"defaults domain: {bundle_id}")
+
                 # If it's an App Store app, also try with sudo
                 if is_app_store and (password or self.sudo_password):
                     cmd = ["defaults", "delete", bundle_id]
                     output, error = self.run_with_sudo(cmd, password)
                     if not error:
-                        removed_files.append(f"defaults domain (sudo): {bundle_id}")
+                        report(f"defaults domain (sudo): {bundle_id}")
             except Exception as e:
                 print(f"Error deleting defaults for {bundle_id}: {e}")
         
         return removed_files
     
-    def remove_application(self, app_name, password=None):
+    def _wait_for_defaults(self):
+        """Reap any in-flight defaults delete processes"""
+        while self._defaults_procs:
+            self._defaults_procs.pop().wait()
+
+    def remove_application(self, app_name, password=None, on_removed=None):
         """
         Main method to remove an application and all its associated data
+
+        When on_removed is given, removed paths are streamed to it
+        instead of being collected in the result dict.
         """
-        # Store the password for future sudo operations
+        # Keep the password on the instance only for the duration of this
+        # call; it is cleared on every exit path below so no plaintext
+        # copy outlives the removal on a session-long KeyRemover
         if password:
             self.sudo_password = password
-            
+
         app_path = self.find_app_path(app_name)
-        
+
         if not app_path:
+            self.sudo_password = None
             return {
                 'success': False,
                 'message': f"Application '{app_name}' not found in /Applications",
@@ -227,15 +473,27 @@ class KeyRemover:
         app_info = self.get_app_info(app_path)
         
         # Check if this is an App Store app
-        is_app_store = self.is_app_store_app(app_info)
-        
+        is_app_store = self.is_app_store_app(app_info, app_path)
+
         # Remove associated files first
-        removed_files = self.remove_app_files(app_info, password)
+        removed_files = self.remove_app_files(app_info, is_app_store, password,
+                                              on_removed)
+        report = on_removed if on_removed is not None else removed_files.append
         
         # Now remove the application itself
         try:
-            # For App Store apps or system apps, use sudo
-            if is_app_store or not os.access(app_path, os.W_OK):
+            # App Store apps always need sudo; otherwise try the regular
+            # removal and escalate on PermissionError rather than paying
+            # an os.access stat up front
+            use_sudo = is_app_store
+            if not use_sudo:
+                try:
+                    self._fast_rmtree(app_path)
+                    report(str(app_path))
+                except PermissionError:
+                    use_sudo = True
+
+            if use_sudo:
                 if not password and not self.sudo_password:
                     return {
                         'success': False,
@@ -243,10 +501,10 @@ class KeyRemover:
                         'removed_files': removed_files,
                         'needs_sudo': True
                     }
-                
+
                 cmd = ["rm", "-rf", str(app_path)]
                 output, error = self.run_with_sudo(cmd, password)
-                
+
                 if error:
                     return {
                         'success': False,
@@ -254,13 +512,14 @@ class KeyRemover:
                         'removed_files': removed_files,
                         'needs_sudo': True
                     }
-                
-                removed_files.append(f"{app_path} (sudo)")
-            else:
-                # Regular removal for user-installed apps
-                shutil.rmtree(app_path)
-                removed_files.append(str(app_path))
-            
+
+                report(f"{app_path} (sudo)")
+
+            # The bundle is gone; drop its cached Info.plist so a
+            # reinstall at the same path (possibly with a different
+            # bundle_id) is re-read on the next removal
+            self._app_info_cache.pop(str(app_path), None)
+
             return {
                 'success': True,
                 'message': f"Successfully removed {app_name} and its associated files",
@@ -283,6 +542,11 @@ class KeyRemover:
                     'removed_files': removed_files,
                     'needs_sudo': False
                 }
+        finally:
+            # Drop the plaintext copy; the GUI wipes its bytearray after
+            # this returns, and a stored str here would defeat that
+            self.sudo_password = None
+            self._wait_for_defaults()
 
 
 def main():
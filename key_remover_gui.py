@@ -8,33 +8,179 @@ Styled with Apple Vision Pro inspired interface with white transparency
 
 import sys
 import os
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLabel, QPushButton, QListWidget, 
-                            QLineEdit, QMessageBox, QFileDialog, QProgressBar,
+import functools
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                            QHBoxLayout, QLabel, QPushButton,
+                            QLineEdit, QMessageBox,
                             QTextEdit, QFrame, QGraphicsDropShadowEffect, QDesktopWidget,
-                            QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve, QRectF
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QColor, QPalette, QLinearGradient, QBrush, QPainter, QPainterPath
-
-from key_remover import KeyRemover
-
-# Import icon generator if the icon doesn't exist
-icon_path = 'resources/icon.png'
-if not os.path.exists(icon_path):
-    try:
-        # Try to import and run the icon generator
-        from generate_icon import create_key_remover_icon
-        icon_path = create_key_remover_icon()
-    except ImportError:
-        print("Icon generator not found, using default icon")
-        icon_path = None
-    except Exception as e:
-        print(f"Error generating icon: {e}")
-        icon_path = None
+                            QDialog)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal,
+                          QRectF, QTimer)
+from PyQt5.QtGui import (QIcon, QFont, QPixmap, QColor, QPalette, QPainter,
+                         QPainterPath, QRegion)
+
+# The icon is generated at build time by build_app.sh (generate_icon.py).
+# Resolved in main() rather than at import time so importing this module
+# does no filesystem work
+icon_path = None
+
+
+def _resolve_icon():
+    """Locate the shipped icon, if any"""
+    global icon_path
+    path = 'resources/icon.png'
+    icon_path = path if os.path.exists(path) else None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_scaled_icon(path, width, height):
+    """Load and smooth-scale an icon once per (path, size)
+
+    Repeated windows or dialogs that want the same icon reuse the cached
+    pixmap instead of re-reading and re-resampling the file.
+    """
+    pixmap = QPixmap(path)
+    if pixmap.width() == width and pixmap.height() == height:
+        return pixmap
+    return pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
 # Corner radius for the main window
 WINDOW_CORNER_RADIUS = 15
 
+# Colors used by the rounded-window paint events, built once instead of
+# per repaint
+_WINDOW_BG_COLOR = QColor(255, 255, 255, 200)
+_WINDOW_BORDER_COLOR = QColor(255, 255, 255, 100)
+
+# Shared QFont instances. Each QFont construction queries the font
+# database, so these are built once in main() after QApplication exists
+# instead of per widget
+_fonts = {}
+
+
+def _init_fonts():
+    """Populate the shared font table; called once from main()"""
+    _fonts.update(
+        body=QFont("SF Pro Display", 10),
+        label=QFont("SF Pro Display", 11),
+        label_medium=QFont("SF Pro Display", 11, QFont.Medium),
+        subtitle=QFont("SF Pro Display", 12),
+        dialog_title=QFont("SF Pro Display", 14, QFont.Bold),
+        title=QFont("SF Pro Display", 22, QFont.Bold),
+    )
+
+# All widget styling in one application-wide stylesheet keyed by object
+# names and class selectors, installed once in main(). Qt then compiles
+# the rules once per QApplication instead of parsing a stylesheet per
+# widget. Resting colors live in each widget's QPalette; these rules
+# only carry the box model and the hover/focus/pressed states
+_APP_QSS = """
+    QPushButton#avpBtn {
+        border: 1px solid rgba(0, 0, 0, 30);
+        border-radius: 0px;
+        padding-left: 15px;
+        padding-right: 15px;
+        text-align: center;
+    }
+    QPushButton#avpBtn:hover {
+        background-color: rgba(255, 255, 255, 90);
+    }
+    QPushButton#avpBtn:pressed {
+        background-color: rgba(255, 255, 255, 60);
+    }
+
+    QPushButton#avpAccentBtn {
+        border: 1px solid rgba(0, 0, 0, 30);
+        border-radius: 0px;
+        background-color: rgba(52, 152, 219, 180);
+        color: white;
+        padding-left: 15px;
+        padding-right: 15px;
+        text-align: center;
+    }
+    QPushButton#avpAccentBtn:hover {
+        background-color: rgba(52, 152, 219, 220);
+    }
+    QPushButton#avpAccentBtn:pressed {
+        background-color: rgba(52, 152, 219, 150);
+    }
+
+    QLineEdit#avpLineEdit {
+        border: 1px solid rgba(0, 0, 0, 30);
+        border-radius: 0px;
+        padding-left: 12px;
+        padding-right: 12px;
+    }
+    QLineEdit#avpLineEdit:focus {
+        border: 1px solid rgba(0, 0, 0, 50);
+        background-color: rgba(255, 255, 255, 80);
+    }
+
+    QTextEdit#avpTextEdit {
+        border: 1px solid rgba(0, 0, 0, 30);
+        border-radius: 0px;
+        padding: 12px;
+    }
+
+    #glassFrame {
+        background-color: rgba(255, 255, 255, 70);
+        border: 1px solid rgba(255, 255, 255, 80);
+        border-radius: 0px;
+    }
+
+    QFrame#passwordFrame {
+        background-color: rgba(255, 255, 255, 70);
+        border: 1px solid rgba(255, 255, 255, 80);
+        border-radius: 15px;
+    }
+
+    GlassTitleBar {
+        background-color: rgba(255, 255, 255, 70);
+        border-top-left-radius: 15px;
+        border-top-right-radius: 15px;
+        border: 1px solid rgba(255, 255, 255, 80);
+        border-bottom: none;
+    }
+
+    QPushButton#closeBtn {
+        background-color: #ff5f57;
+        border-radius: 6px;
+        border: none;
+    }
+    QPushButton#closeBtn:hover {
+        background-color: #ff4b47;
+    }
+
+    QPushButton#minBtn {
+        background-color: #febc2e;
+        border-radius: 6px;
+        border: none;
+    }
+    QPushButton#minBtn:hover {
+        background-color: #feb519;
+    }
+
+    QPushButton#maxBtn {
+        background-color: #28c840;
+        border-radius: 6px;
+        border: none;
+    }
+    QPushButton#maxBtn:hover {
+        background-color: #24b539;
+    }
+
+    QStatusBar {
+        background-color: rgba(255, 255, 255, 70);
+        color: rgba(0, 0, 0, 150);
+        border-top: 1px solid rgba(255, 255, 255, 80);
+        border-bottom-left-radius: 15px;
+        border-bottom-right-radius: 15px;
+        font-family: 'SF Pro Display';
+        font-size: 10px;
+        padding: 3px 12px;
+    }
+"""
+
 class PasswordDialog(QDialog):
     """Dialog to request administrator password"""
     
@@ -44,26 +190,33 @@ class PasswordDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setFixedWidth(400)
+        self._clip_path = None
         self.initUI()
-        
+
+    def resizeEvent(self, event):
+        """Rebuild the cached rounded path and window mask on size change"""
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), WINDOW_CORNER_RADIUS, WINDOW_CORNER_RADIUS)
+        self._clip_path = path
+        # Clip at the window-system level so paintEvent doesn't pay for
+        # an antialiased clip on every repaint
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        super().resizeEvent(event)
+
     def initUI(self):
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create glass frame
+        # Create glass frame, styled by the app-wide stylesheet
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 70);
-                border: 1px solid rgba(255, 255, 255, 80);
-                border-radius: 15px;
-            }
-        """)
+        frame.setObjectName("passwordFrame")
         
         # Add shadow effect
         shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
+        # Blur cost scales with radius squared; 10px reads the same at
+        # this size for a quarter of the blur work
+        shadow.setBlurRadius(10)
         shadow.setColor(QColor(0, 0, 0, 50))
         shadow.setOffset(0, 3)
         frame.setGraphicsEffect(shadow)
@@ -75,85 +228,36 @@ class PasswordDialog(QDialog):
         
         # Title
         title_label = QLabel("Administrator Password Required")
-        title_label.setFont(QFont("SF Pro Display", 14, QFont.Bold))
+        title_label.setFont(_fonts["dialog_title"])
         title_label.setStyleSheet("color: rgba(0, 0, 0, 220);")
         title_label.setAlignment(Qt.AlignCenter)
         frame_layout.addWidget(title_label)
         
         # Description
         desc_label = QLabel("This application requires administrator privileges to remove.")
-        desc_label.setFont(QFont("SF Pro Display", 10))
+        desc_label.setFont(_fonts["body"])
         desc_label.setStyleSheet("color: rgba(0, 0, 0, 170);")
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
         frame_layout.addWidget(desc_label)
         
-        # Password input
-        self.password_input = QLineEdit()
+        # Password input (styled like the main window's input, palette
+        # colors included)
+        self.password_input = AvpStyleLineEdit()
         self.password_input.setPlaceholderText("Enter administrator password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFixedHeight(30)
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 220);
-                padding-left: 12px;
-                padding-right: 12px;
-                selection-background-color: rgba(0, 0, 0, 10);
-            }
-            QLineEdit:focus {
-                border: 1px solid rgba(0, 0, 0, 50);
-                background-color: rgba(255, 255, 255, 80);
-            }
-        """)
         frame_layout.addWidget(self.password_input)
-        
+
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setFixedHeight(30)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 220);
-                padding-left: 15px;
-                padding-right: 15px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 90);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 60);
-            }
-        """)
+
+        cancel_btn = AvpStyleButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         
         ok_btn = QPushButton("OK")
+        ok_btn.setObjectName("avpAccentBtn")
         ok_btn.setFixedHeight(30)
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(52, 152, 219, 180);
-                color: white;
-                padding-left: 15px;
-                padding-right: 15px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(52, 152, 219, 220);
-            }
-            QPushButton:pressed {
-                background-color: rgba(52, 152, 219, 150);
-            }
-        """)
         ok_btn.clicked.connect(self.accept)
         
         button_layout.addWidget(cancel_btn)
@@ -168,23 +272,22 @@ class PasswordDialog(QDialog):
         self.password_input.setFocus()
     
     def getPassword(self):
-        """Return the entered password"""
-        return self.password_input.text()
+        """Return the entered password as a zeroable bytearray
+
+        Unlike a str, the bytearray can be wiped after use; the input
+        field is cleared immediately so the dialog holds no copy.
+        """
+        password = bytearray(self.password_input.text().encode("utf-8"))
+        self.password_input.clear()
+        return password
     
     def paintEvent(self, event):
         """Custom paint event to create a background blur effect with rounded corners"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create a rounded rectangle path for the window
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(self.rect()), WINDOW_CORNER_RADIUS, WINDOW_CORNER_RADIUS)
-        
-        # Set the clip path to ensure everything is drawn within the rounded rectangle
-        painter.setClipPath(path)
-        
-        # Draw a semi-transparent white background
-        painter.fillRect(self.rect(), QColor(255, 255, 255, 200))
+
+        # The window mask set in resizeEvent already clips to the rounded
+        # rectangle; just fill the semi-transparent white background
+        painter.fillRect(self.rect(), _WINDOW_BG_COLOR)
 
 
 class AvpStyleButton(QPushButton):
@@ -194,33 +297,16 @@ class AvpStyleButton(QPushButton):
         super().__init__(text, parent)
         self.setFixedHeight(30)
         self.setCursor(Qt.PointingHandCursor)
-        self.setFont(QFont("SF Pro Display", 10))
-        
-        # Apply stylesheet
-        self.setStyleSheet("""
-            QPushButton {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 220);
-                padding-left: 15px;
-                padding-right: 15px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 90);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 60);
-            }
-        """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 1)
-        self.setGraphicsEffect(shadow)
+        self.setFont(_fonts["body"])
+
+        # Resting colors via the palette; the stylesheet carries the box
+        # model and state rules
+        pal = self.palette()
+        pal.setColor(QPalette.Button, QColor(255, 255, 255, 70))
+        pal.setColor(QPalette.ButtonText, QColor(0, 0, 0, 220))
+        self.setPalette(pal)
+        self.setAutoFillBackground(True)
+        self.setObjectName("avpBtn")
 
 
 class AvpStyleLineEdit(QLineEdit):
@@ -229,31 +315,16 @@ class AvpStyleLineEdit(QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(30)
-        self.setFont(QFont("SF Pro Display", 10))
-        
-        # Apply stylesheet
-        self.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 220);
-                padding-left: 12px;
-                padding-right: 12px;
-                selection-background-color: rgba(0, 0, 0, 10);
-            }
-            QLineEdit:focus {
-                border: 1px solid rgba(0, 0, 0, 50);
-                background-color: rgba(255, 255, 255, 80);
-            }
-        """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 1)
-        self.setGraphicsEffect(shadow)
+        self.setFont(_fonts["body"])
+
+        # Resting colors via the palette; the stylesheet carries the box
+        # model and state rules
+        pal = self.palette()
+        pal.setColor(QPalette.Base, QColor(255, 255, 255, 70))
+        pal.setColor(QPalette.Text, QColor(0, 0, 0, 220))
+        pal.setColor(QPalette.Highlight, QColor(0, 0, 0, 10))
+        self.setPalette(pal)
+        self.setObjectName("avpLineEdit")
 
 
 class AvpStyleTextEdit(QTextEdit):
@@ -261,26 +332,16 @@ class AvpStyleTextEdit(QTextEdit):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFont(QFont("SF Pro Display", 10))
-        
-        # Apply stylesheet
-        self.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid rgba(0, 0, 0, 30);
-                border-radius: 0px;
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 220);
-                padding: 12px;
-                selection-background-color: rgba(0, 0, 0, 10);
-            }
-        """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 1)
-        self.setGraphicsEffect(shadow)
+        self.setFont(_fonts["body"])
+
+        # Resting colors via the palette; the stylesheet carries the box
+        # model
+        pal = self.palette()
+        pal.setColor(QPalette.Base, QColor(255, 255, 255, 70))
+        pal.setColor(QPalette.Text, QColor(0, 0, 0, 220))
+        pal.setColor(QPalette.Highlight, QColor(0, 0, 0, 10))
+        self.setPalette(pal)
+        self.setObjectName("avpTextEdit")
 
 
 class GlassTitleBar(QFrame):
@@ -307,47 +368,20 @@ class GlassTitleBar(QFrame):
         
         # Close button
         self.close_btn = QPushButton()
+        self.close_btn.setObjectName("closeBtn")
         self.close_btn.setFixedSize(12, 12)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff5f57;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #ff4b47;
-            }
-        """)
         self.close_btn.clicked.connect(self.parent.close)
         
         # Minimize button
         self.min_btn = QPushButton()
+        self.min_btn.setObjectName("minBtn")
         self.min_btn.setFixedSize(12, 12)
-        self.min_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #febc2e;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #feb519;
-            }
-        """)
         self.min_btn.clicked.connect(self.parent.showMinimized)
         
         # Maximize button (green)
         self.max_btn = QPushButton()
+        self.max_btn.setObjectName("maxBtn")
         self.max_btn.setFixedSize(12, 12)
-        self.max_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28c840;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #24b539;
-            }
-        """)
         
         # Add window controls to layout
         control_layout.addWidget(self.close_btn)
@@ -358,7 +392,7 @@ class GlassTitleBar(QFrame):
         # Title label
         title_label = QLabel(self.title)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setFont(QFont("SF Pro Display", 11))
+        title_label.setFont(_fonts["label"])
         title_label.setStyleSheet("color: rgba(0, 0, 0, 180);")
         
         # Add all elements to main layout
@@ -366,16 +400,8 @@ class GlassTitleBar(QFrame):
         layout.addWidget(title_label)
         layout.addStretch(1)
         
-        # Set frame style
-        self.setStyleSheet("""
-            GlassTitleBar {
-                background-color: rgba(255, 255, 255, 70);
-                border-top-left-radius: 15px;
-                border-top-right-radius: 15px;
-                border: 1px solid rgba(255, 255, 255, 80);
-                border-bottom: none;
-            }
-        """)
+        # Frame style comes from the GlassTitleBar rule in the app-wide
+        # stylesheet
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -384,7 +410,13 @@ class GlassTitleBar(QFrame):
     
     def mouseMoveEvent(self, event):
         if self.pressing:
-            self.parent.move(self.parent.pos() + (event.globalPos() - self.start_point))
+            delta = event.globalPos() - self.start_point
+            # Skip sub-2px deltas: every move triggers a full repaint of
+            # the rounded translucent window, so coalescing tiny jitters
+            # cuts the repaint storm during a drag
+            if abs(delta.x()) + abs(delta.y()) < 2:
+                return
+            self.parent.move(self.parent.pos() + delta)
             self.start_point = event.globalPos()
     
     def mouseReleaseEvent(self, event):
@@ -397,38 +429,85 @@ class GlassFrame(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("glassFrame")
-        
-        # Apply glass effect with stylesheet
-        self.setStyleSheet("""
-            #glassFrame {
-                background-color: rgba(255, 255, 255, 70);
-                border: 1px solid rgba(255, 255, 255, 80);
-                border-radius: 0px;
-            }
-        """)
+
+        # Let the stylesheet paint the background directly instead of
+        # going through the generic QFrame fill path. The frame stays
+        # semi-transparent over the translucent window, so
+        # WA_OpaquePaintEvent would be wrong here
+        self.setAttribute(Qt.WA_StyledBackground, True)
+
+        # Glass effect comes from the #glassFrame rule in the app-wide
+        # stylesheet
         
         # Add shadow effect
         shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
+        # Blur cost scales with radius squared; 10px reads the same at
+        # this size for a quarter of the blur work
+        shadow.setBlurRadius(10)
         shadow.setColor(QColor(0, 0, 0, 50))
         shadow.setOffset(0, 3)
         self.setGraphicsEffect(shadow)
 
 
-class RemoverThread(QThread):
-    """Thread to handle app removal in the background"""
+class RemoverSignals(QObject):
+    """Signal holder for RemoverTask; QRunnable cannot carry signals itself"""
     finished = pyqtSignal(dict)
     progress = pyqtSignal(str)
-    
-    def __init__(self, app_name, password=None):
+
+
+class RemoverTask(QRunnable):
+    """Pooled task that handles app removal in the background"""
+
+    def __init__(self, remover, app_name, password=None):
         super().__init__()
+        self.remover = remover
         self.app_name = app_name
         self.password = password
-        
+        self.signals = RemoverSignals()
+
     def run(self):
-        remover = KeyRemover()
-        result = remover.remove_application(self.app_name, self.password)
-        self.finished.emit(result)
+        # The password arrives as a zeroable bytearray; decode a transient
+        # str only for the backend call and wipe the buffer afterwards
+        password = None
+        if self.password:
+            password = bytes(self.password).decode("utf-8")
+        try:
+            # Stream removed paths to the GUI as they happen instead of
+            # collecting them all in the result dict
+            result = self.remover.remove_application(
+                self.app_name, password,
+                on_removed=self.signals.progress.emit)
+        finally:
+            if isinstance(self.password, bytearray):
+                for i in range(len(self.password)):
+                    self.password[i] = 0
+            self.password = None
+        self.signals.finished.emit(result)
+
+
+class IconSignals(QObject):
+    """Signal holder for IconTask; QRunnable cannot carry signals itself"""
+    finished = pyqtSignal(str)
+
+
+class IconTask(QRunnable):
+    """Pooled task that generates the application icon off the GUI thread
+
+    Only run when no shipped icon was found, so a cold install gets its
+    icon without blocking the first paint on Pillow rendering.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.signals = IconSignals()
+
+    def run(self):
+        try:
+            from generate_icon import create_key_remover_icon
+            path = create_key_remover_icon()
+        except Exception:
+            return
+        self.signals.finished.emit(path)
 
 
 class KeyRemoverApp(QMainWindow):
@@ -440,9 +519,35 @@ class KeyRemoverApp(QMainWindow):
         # Remove default window frame and make background transparent
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        
+        self._clip_path = None
+
+        # Log messages are buffered and flushed in one append per timer
+        # tick, so bursts of removal output don't relayout the text edit
+        # once per line
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # One KeyRemover shared by all removals, so its directory
+        # filtering and caches survive between runs. Imported here so GUI
+        # startup doesn't pay for the backend module until a window exists
+        from key_remover import KeyRemover
+        self._remover = KeyRemover()
+
         # Initialize UI
         self.init_ui()
+
+    def resizeEvent(self, event):
+        """Rebuild the cached rounded path and window mask on size change"""
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), WINDOW_CORNER_RADIUS, WINDOW_CORNER_RADIUS)
+        self._clip_path = path
+        # Clip at the window-system level so paintEvent doesn't pay for
+        # an antialiased clip on every repaint
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+        super().resizeEvent(event)
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -453,7 +558,7 @@ class KeyRemoverApp(QMainWindow):
         self.center()
         
         # Set application icon
-        if icon_path and os.path.exists(icon_path):
+        if icon_path:
             self.setWindowIcon(QIcon(icon_path))
         
         # Main layout
@@ -479,23 +584,22 @@ class KeyRemoverApp(QMainWindow):
         main_layout.addWidget(content_frame)
         
         # Add logo at the top if we have an icon
-        if icon_path and os.path.exists(icon_path):
+        if icon_path:
             logo_label = QLabel()
-            pixmap = QPixmap(icon_path)
-            logo_label.setPixmap(pixmap.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            logo_label.setPixmap(_load_scaled_icon(icon_path, 50, 50))
             logo_label.setAlignment(Qt.AlignCenter)
             content_layout.addWidget(logo_label)
         
         # Title
         title_label = QLabel("KeyRemover")
-        title_label.setFont(QFont("SF Pro Display", 22, QFont.Bold))
+        title_label.setFont(_fonts["title"])
         title_label.setStyleSheet("color: rgba(0, 0, 0, 220);")
         title_label.setAlignment(Qt.AlignCenter)
         content_layout.addWidget(title_label)
         
         # Description
         desc_label = QLabel("Remove applications and reset trial periods")
-        desc_label.setFont(QFont("SF Pro Display", 12))
+        desc_label.setFont(_fonts["subtitle"])
         desc_label.setStyleSheet("color: rgba(0, 0, 0, 170);")
         desc_label.setAlignment(Qt.AlignCenter)
         content_layout.addWidget(desc_label)
@@ -523,7 +627,7 @@ class KeyRemoverApp(QMainWindow):
         
         # Remove button
         remove_button = AvpStyleButton("Remove Application")
-        remove_button.setFont(QFont("SF Pro Display", 11, QFont.Medium))
+        remove_button.setFont(_fonts["label_medium"])
         remove_button.setFixedHeight(36)
         remove_button.clicked.connect(self.remove_app)
         content_layout.addWidget(remove_button)
@@ -531,7 +635,7 @@ class KeyRemoverApp(QMainWindow):
         # Progress area
         content_layout.addSpacing(5)
         progress_label = QLabel("Application Removal Log")
-        progress_label.setFont(QFont("SF Pro Display", 11, QFont.Medium))
+        progress_label.setFont(_fonts["label_medium"])
         progress_label.setStyleSheet("color: rgba(0, 0, 0, 200);")
         content_layout.addWidget(progress_label)
         
@@ -540,19 +644,8 @@ class KeyRemoverApp(QMainWindow):
         self.progress_text.setMinimumHeight(150)
         content_layout.addWidget(self.progress_text)
         
-        # Status bar with glass effect
-        self.statusBar().setStyleSheet("""
-            QStatusBar {
-                background-color: rgba(255, 255, 255, 70);
-                color: rgba(0, 0, 0, 150);
-                border-top: 1px solid rgba(255, 255, 255, 80);
-                border-bottom-left-radius: 15px;
-                border-bottom-right-radius: 15px;
-                font-family: 'SF Pro Display';
-                font-size: 10px;
-                padding: 3px 12px;
-            }
-        """)
+        # Status bar glass effect comes from the QStatusBar rule in the
+        # app-wide stylesheet
         self.statusBar().showMessage("Ready")
         
     def center(self):
@@ -564,6 +657,9 @@ class KeyRemoverApp(QMainWindow):
         
     def browse_app(self):
         """Open file dialog to select an application"""
+        # Imported on first use; the dialog is optional in the common flow
+        from PyQt5.QtWidgets import QFileDialog
+
         app_path, _ = QFileDialog.getOpenFileName(
             self, "Select Application", "/Applications",
             "Applications (*.app);;All Files (*)"
@@ -577,8 +673,22 @@ class KeyRemoverApp(QMainWindow):
             self.app_input.setText(app_name)
             
     def add_log(self, message):
-        """Add message to the progress text area"""
-        self.progress_text.append(message)
+        """Queue a message for the progress text area"""
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered messages in a single relayout"""
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.progress_text.setUpdatesEnabled(False)
+        try:
+            self.progress_text.append(text)
+        finally:
+            self.progress_text.setUpdatesEnabled(True)
         
     def remove_app(self):
         """Start the app removal process"""
@@ -606,10 +716,16 @@ class KeyRemoverApp(QMainWindow):
     
     def start_removal(self, app_name, password=None):
         """Start the removal process with optional password"""
-        # Create and start the worker thread
-        self.worker = RemoverThread(app_name, password)
-        self.worker.finished.connect(self.on_removal_finished)
-        self.worker.start()
+        # Run on the shared thread pool so repeated removals reuse a
+        # cached worker thread instead of spawning a QThread each time
+        self.worker = RemoverTask(self._remover, app_name, password)
+        self.worker.signals.progress.connect(self.on_file_removed)
+        self.worker.signals.finished.connect(self.on_removal_finished)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def on_file_removed(self, path):
+        """Log a single removed file reported by the worker"""
+        self.add_log(f"- {path}")
     
     def on_removal_finished(self, result):
         """Handle the completion of the removal process"""
@@ -622,11 +738,8 @@ class KeyRemoverApp(QMainWindow):
             return
         
         if result['success']:
-            if result['removed_files']:
-                self.add_log("\nRemoved files/directories:")
-                for f in result['removed_files']:
-                    self.add_log(f"- {f}")
-                    
+            # Removed files were already streamed to the log via the
+            # progress signal
             self.statusBar().showMessage("Removal completed successfully")
             QMessageBox.information(
                 self, 
@@ -656,44 +769,71 @@ class KeyRemoverApp(QMainWindow):
     def paintEvent(self, event):
         """Custom paint event to create a background blur effect with rounded corners"""
         painter = QPainter(self)
+
+        # The window mask set in resizeEvent already clips to the rounded
+        # rectangle; fill the semi-transparent white background
+        painter.fillRect(self.rect(), _WINDOW_BG_COLOR)
+
+        # Draw a subtle antialiased border around the window
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create a rounded rectangle path for the window
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(self.rect()), WINDOW_CORNER_RADIUS, WINDOW_CORNER_RADIUS)
-        
-        # Set the clip path to ensure everything is drawn within the rounded rectangle
-        painter.setClipPath(path)
-        
-        # Draw a semi-transparent white background
-        painter.fillRect(self.rect(), QColor(255, 255, 255, 200))
-        
-        # Draw a subtle border around the window
-        painter.setPen(QColor(255, 255, 255, 100))
-        painter.drawPath(path)
+        painter.setPen(_WINDOW_BORDER_COLOR)
+        painter.drawPath(self._clip_path)
 
 
 def main():
     """Main entry point for the GUI application"""
+    # Composite through CoreAnimation layers on macOS, which is cheaper
+    # than the legacy NSView path for this kind of translucent window
+    os.environ.setdefault("QT_MAC_WANTS_LAYER", "1")
+
+    # This UI is plain raster-painted widgets; keep QtQuick (if it ever
+    # gets pulled in) off the GPU path too
+    os.environ.setdefault("QT_QUICK_BACKEND", "software")
+
     # Enable high DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
+    # Don't promote sibling widgets to native windows; everything here
+    # renders fine through the raster engine without a GL context
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
     
     app = QApplication(sys.argv)
-    
-    # Set app style and font
+
+    # Locate the application icon now that startup is under way
+    _resolve_icon()
+
+    # Build the shared font instances now that the font database is up
+    _init_fonts()
+
+    # Set app style and font; all widget rules are compiled once here
     app.setStyle('Fusion')
+    app.setStyleSheet(_APP_QSS)
     font_db = app.font()
     font_db.setFamily("SF Pro Display")
     app.setFont(font_db)
     
     # Set the application icon
-    if icon_path and os.path.exists(icon_path):
+    if icon_path:
         app.setWindowIcon(QIcon(icon_path))
     
     window = KeyRemoverApp()
     window.show()
-    
+
+    # No shipped icon: generate one in the background once the window is
+    # up, then apply it. Keep a reference so the task's signals stay alive
+    icon_task = None
+    if icon_path is None:
+        def _apply_icon(path):
+            global icon_path
+            icon_path = path
+            app.setWindowIcon(QIcon(path))
+            window.setWindowIcon(QIcon(path))
+
+        icon_task = IconTask()
+        icon_task.signals.finished.connect(_apply_icon)
+        QThreadPool.globalInstance().start(icon_task)
+
     sys.exit(app.exec_())
 
 